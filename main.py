@@ -1,30 +1,49 @@
 """Main application module for CI/CD configuration API."""
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
+import orjson
 import os
 
+# Environment is fixed for the lifetime of the process; read it once.
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+PORT = os.getenv("PORT", "8000")
+
+_ROOT_RESPONSE = {
+    "message": "Hello World",
+    "status": "Running",
+    "environment": ENVIRONMENT,
+    "port": PORT
+}
+_ROOT_BYTES = orjson.dumps(_ROOT_RESPONSE)  # pylint: disable=no-member
+_HEALTH_RESPONSE = {"status": "healthy"}
+_HEALTH_BYTES = orjson.dumps(_HEALTH_RESPONSE)  # pylint: disable=no-member
+
 app = FastAPI(
     title="CI/CD Configuration API",
     description="API for CI/CD configuration service",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
 @app.get("/")
 async def root():
-    return {
-        "message": "Hello World",
-        "status": "Running",
-        "environment": os.getenv("ENVIRONMENT", "development"),
-        "port": os.getenv("PORT", "8000")
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint for monitoring."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
-    host = os.getenv("HOST", "0.0.0.0")
-    port = int(os.getenv("PORT", "8000"))
-    reload_enabled = os.getenv("ENVIRONMENT", "development").lower() == "development"
-    uvicorn.run(app, host=host, port=port, reload=reload_enabled)
\ No newline at end of file
+    host = os.environ.get("HOST", "0.0.0.0")
+    port = int(PORT)
+    reload_enabled = ENVIRONMENT.lower() == "development"
+    # Reload and multiple workers both need the app as an import string.
+    if reload_enabled:
+        workers = 1
+    else:
+        workers = int(os.environ.get("WEB_CONCURRENCY") or os.cpu_count() or 1)
+    uvicorn.run(
+        "main:app", host=host, port=port, reload=reload_enabled, workers=workers
+    )
\ No newline at end of file